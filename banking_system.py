@@ -1,38 +1,114 @@
 import os
-import datetime
-import random
+import atexit
 import hashlib
+import math
+import hmac
+import mmap
+import re
+import struct
 import time
 import sys
+from functools import lru_cache
 from getpass import getpass
+from typing import ClassVar, Optional, TypedDict
+
+@lru_cache(maxsize=128)
+def _hash_password(password: str, salt: str) -> str:
+    """Derive the scrypt key for a password and hex salt, cached for the session"""
+    key = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=2**14, r=8, p=1, dklen=32)
+    return key.hex()
+
+def _parse_cents(text: str) -> int:
+    """Parse a stored dollar amount like '100.0' or '10.50' as integer cents"""
+    # Up to two decimals is read exactly, anything else goes through float
+    whole, _, fraction = text.partition(".")
+    if whole.isascii() and whole.isdigit() and len(fraction) <= 2 and (not fraction or fraction.isdigit()):
+        return int(whole) * 100 + int(fraction.ljust(2, "0"))
+    
+    dollars = float(text)
+    # Older versions accepted 'inf' and 'nan' deposits and wrote them out as-is
+    if not math.isfinite(dollars):
+        raise ValueError(f"Stored amount {text!r} is not a finite number.")
+    return round(dollars * 100)
+
+def _format_dollars(cents: int) -> str:
+    """Format integer cents as an exact dollar amount like '10.50' for the text files"""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+def _now_str(seconds: Optional[float] = None) -> str:
+    """Format a time (default: now) as local 'YYYY-MM-DD HH:MM:SS' without a datetime object"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+def _to_cents(text: str) -> int:
+    """Convert a dollar amount typed by the user to integer cents"""
+    dollars = float(text)
+    if not math.isfinite(dollars):
+        raise ValueError("Amount must be a finite number.")
+    return round(dollars * 100)
+
+# Fixed-width account record: account number, name, scrypt salt, key, balance in cents.
+# Old SHA-256 accounts have an all-zero salt and the bare hash as the key.
+ACCOUNT_RECORD = struct.Struct("<6s32s16s32sQ")
+PASSWORD_OFFSET = 6 + 32
+BALANCE_OFFSET = ACCOUNT_RECORD.size - 8
+MAX_BALANCE = 2**64 - 1  # Largest balance in cents the unsigned 64-bit field can hold
+
+# Account numbers are 100000 + (n * ACCOUNT_NUMBER_MULTIPLIER) % 900000 for a counter n.
+# The multiplier shares no factor with 900000, so every n below 900000 maps to a different number.
+ACCOUNT_NUMBER_COUNT = 900000
+ACCOUNT_NUMBER_MULTIPLIER = 524287
 
 # ANSI color codes for terminal
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+class _ColorsANSI:
+    HEADER: ClassVar[str] = '\033[95m'
+    BLUE: ClassVar[str] = '\033[94m'
+    CYAN: ClassVar[str] = '\033[96m'
+    GREEN: ClassVar[str] = '\033[92m'
+    WARNING: ClassVar[str] = '\033[93m'
+    FAIL: ClassVar[str] = '\033[91m'
+    ENDC: ClassVar[str] = '\033[0m'
+    BOLD: ClassVar[str] = '\033[1m'
+    UNDERLINE: ClassVar[str] = '\033[4m'
+
+# Same names with no codes, for NO_COLOR or output that isn't a terminal
+class _ColorsPlain:
+    HEADER: ClassVar[str] = ''
+    BLUE: ClassVar[str] = ''
+    CYAN: ClassVar[str] = ''
+    GREEN: ClassVar[str] = ''
+    WARNING: ClassVar[str] = ''
+    FAIL: ClassVar[str] = ''
+    ENDC: ClassVar[str] = ''
+    BOLD: ClassVar[str] = ''
+    UNDERLINE: ClassVar[str] = ''
+
+_NO_COLOR = bool(os.environ.get("NO_COLOR")) or not sys.stdout.isatty()
+Colors = _ColorsPlain if _NO_COLOR else _ColorsANSI
+
+class Transaction(TypedDict):
+    type: str
+    amount: int  # In cents
+    date: str
 
 class Account:
-    def __init__(self, account_number, name, password, balance):
-        self.account_number = account_number
-        self.name = name
-        self.password = password  # Should be stored as a hash in real applications
-        self.balance = float(balance)
+    def __init__(self, account_number: str, name: str, password: str, balance: int, salt: str = "") -> None:
+        self.account_number: str = account_number
+        self.name: str = name
+        self.password: str = password  # scrypt key, or a bare SHA-256 hash for old accounts
+        self.salt: str = salt  # Empty for old accounts hashed with SHA-256
+        self.balance: int = int(balance)  # In cents
 
-    def deposit(self, amount):
+    def deposit(self, amount: int) -> tuple[bool, str]:
         if amount <= 0:
             return False, "Amount must be positive."
         
+        if self.balance + amount > MAX_BALANCE:
+            return False, "Amount too large."
+        
         self.balance += amount
-        return True, f"Deposit successful! Current balance: ${self.balance:.2f}"
+        return True, f"Deposit successful! Current balance: ${self.balance / 100:.2f}"
 
-    def withdraw(self, amount):
+    def withdraw(self, amount: int) -> tuple[bool, str]:
         if amount <= 0:
             return False, "Amount must be positive."
         
@@ -40,94 +116,271 @@ class Account:
             return False, "Insufficient funds."
         
         self.balance -= amount
-        return True, f"Withdrawal successful! Current balance: ${self.balance:.2f}"
+        return True, f"Withdrawal successful! Current balance: ${self.balance / 100:.2f}"
     
-    def get_balance(self):
+    def get_balance(self) -> int:
         return self.balance
 
 class BankingSystem:
-    def __init__(self):
-        self.accounts_file = "accounts.txt"
-        self.transactions_file = "transactions.txt"
+    def __init__(self) -> None:
+        self.accounts_file: str = "accounts.dat"
+        self.legacy_accounts_file: str = "accounts.txt"
+        self.transactions_file: str = "transactions.txt"
+        self.current_account: Optional[Account] = None
+        self._accounts: dict[str, Account] = {}
+        self._offsets: dict[str, int] = {}
+        self._transactions: dict[str, list[Transaction]] = {}
+        self._txn_buffer: list[str] = []
+        self._last_ts_sec: Optional[int] = None
+        self._last_ts_str: str = ""
+        self.import_warnings: list[str] = []  # Problems found while importing accounts.txt
+        self.unreadable_transactions: dict[str, int] = {}  # Rows skipped per account, e.g. 'inf' amounts
         self.ensure_files_exist()
-        self.current_account = None
-    
-    def ensure_files_exist(self):
+        # Keep both files open for the whole session instead of reopening them on every write
+        self._accounts_fh = open(self.accounts_file, "r+b")
+        self._txn_fh = open(self.transactions_file, "a", buffering=1 << 16)
+        self.load_accounts()
+        # Every record on disk used up one counter value, so it carries on from there
+        self._next_account_seq: int = len(self._offsets)
+        atexit.register(self.close)
+    
+    def ensure_files_exist(self) -> None:
         """Create files if they don't exist"""
         if not os.path.exists(self.accounts_file):
-            with open(self.accounts_file, "w") as f:
-                f.write("")  # Create an empty file
-                
+            if os.path.exists(self.legacy_accounts_file):
+                self.import_legacy_accounts()
+            else:
+                with open(self.accounts_file, "wb") as f:
+                    f.write(b"")  # Create an empty file
+        
         if not os.path.exists(self.transactions_file):
             with open(self.transactions_file, "w") as f:
                 f.write("")  # Create an empty file
     
-    def hash_password(self, password):
-        """Simple password hashing using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
-    def generate_account_number(self):
-        """Generate a unique 6-digit account number"""
-        while True:
-            account_number = str(random.randint(100000, 999999))
+    def load_accounts(self) -> None:
+        """Load all account records into memory and remember where each one lives"""
+        with open(self.accounts_file, "rb") as f:
+            data = f.read()
+        
+        # Ignore a trailing record cut short by a crash
+        size = len(data) - len(data) % ACCOUNT_RECORD.size
+        accounts = [self.unpack_account(fields) for fields in ACCOUNT_RECORD.iter_unpack(memoryview(data)[:size])]
+        self._accounts = {account.account_number: account for account in accounts}
+        self._offsets = {account.account_number: i * ACCOUNT_RECORD.size for i, account in enumerate(accounts)}
+    
+    def import_legacy_accounts(self) -> None:
+        """Convert the old accounts.txt into the fixed-width accounts file.
+        
+        The old file is left in place untouched as a backup.
+        """
+        with open(self.legacy_accounts_file, "r") as f:
+            lines = f.read().splitlines()
+        
+        # The old format was never validated, so report bad records instead of refusing to start
+        accounts: dict[str, Account] = {}
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                account = self.parse_account(line.strip())
+            except ValueError as error:
+                self.import_warnings.append(f"Skipped line {line_number} of {self.legacy_accounts_file}: {error}")
+                continue
+            
+            if account.account_number in accounts:
+                # Logins always found the first record for a number, so that one wins
+                self.import_warnings.append(
+                    f"Skipped line {line_number} of {self.legacy_accounts_file}: "
+                    f"account {account.account_number} appears more than once."
+                )
+                continue
+            
+            # Names are stored in 32 bytes, cut long ones on a character boundary
+            encoded_name = account.name.encode()
+            if len(encoded_name) > 32:
+                name = encoded_name[:32].decode(errors="ignore")
+                self.import_warnings.append(
+                    f"Account {account.account_number} name {account.name!r} is longer than 32 bytes, "
+                    f"importing it as {name!r}."
+                )
+                account.name = name
+            accounts[account.account_number] = account
+        
+        # The old text format had no upper limit, so clamp what the record can't hold
+        for account in accounts.values():
+            if not 0 <= account.balance <= MAX_BALANCE:
+                clamped = min(max(account.balance, 0), MAX_BALANCE)
+                self.import_warnings.append(
+                    f"Account {account.account_number} balance of {account.balance} cents is outside "
+                    f"the supported range 0..{MAX_BALANCE}, importing it as {clamped} cents."
+                )
+                account.balance = clamped
+        
+        # Write to a temporary file first so a crash never leaves a half-written file
+        temp_file = self.accounts_file + ".tmp"
+        data = b"".join(self.pack_account(account) for account in accounts.values())
+        with open(temp_file, "wb", buffering=1 << 20) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.accounts_file)
+    
+    def parse_account(self, record: str) -> Account:
+        """Build an Account from an old 'account,name,sha256,balance' text record"""
+        # Peel the fields off one comma at a time rather than splitting into a list
+        account_number, _, rest = record.partition(",")
+        name, _, rest = rest.partition(",")
+        password, _, balance = rest.partition(",")
+        
+        if not (len(account_number) == 6 and account_number.isascii() and account_number.isdigit()):
+            raise ValueError(f"account number {account_number!r} is not 6 digits.")
+        try:
+            valid_hash = len(bytes.fromhex(password)) == 32
+        except ValueError:
+            valid_hash = False
+        if not valid_hash:
+            raise ValueError(f"account {account_number} has no valid SHA-256 password hash.")
+        try:
+            cents = _parse_cents(balance)
+        except ValueError:
+            raise ValueError(f"account {account_number} has an invalid balance {balance!r}.") from None
+        return Account(account_number, name, password, cents)
+    
+    def pack_account(self, account: Account) -> bytes:
+        """Pack an Account into a fixed-width record"""
+        return ACCOUNT_RECORD.pack(
+            account.account_number.encode(),
+            account.name.encode(),
+            bytes.fromhex(account.salt),
+            bytes.fromhex(account.password),
+            account.balance
+        )
+    
+    def unpack_account(self, fields: tuple[bytes, bytes, bytes, bytes, int]) -> Account:
+        """Build an Account from the unpacked fields of a fixed-width record"""
+        account_number, name, salt, password, balance = fields
+        return Account(
+            account_number.rstrip(b"\0").decode(),
+            name.rstrip(b"\0").decode(errors="ignore"),
+            password.hex(),
+            balance,
+            salt.hex() if any(salt) else ""
+        )
+    
+    def write_record(self, offset: int, data: bytes) -> None:
+        """Overwrite part of the accounts file in place"""
+        self._accounts_fh.seek(offset)
+        self._accounts_fh.write(data)
+        self._accounts_fh.flush()
+    
+    def close(self) -> None:
+        """Flush pending transactions and close the data files"""
+        # Writes only flush to the OS during the session, sync to disk once when closing
+        if not self._txn_fh.closed:
+            self.flush_transactions()
+            self._txn_fh.flush()
+            os.fsync(self._txn_fh.fileno())
+            self._txn_fh.close()
+        if not self._accounts_fh.closed:
+            self._accounts_fh.flush()
+            os.fsync(self._accounts_fh.fileno())
+            self._accounts_fh.close()
+    
+    def hash_password(self, password: str, salt: Optional[str] = None) -> tuple[str, str]:
+        """Hash a password with scrypt, returns the hex salt and key"""
+        if salt is None:
+            salt = os.urandom(16).hex()
+        return salt, _hash_password(password, salt)
+    
+    def verify_password(self, account: Account, password: str) -> bool:
+        """Check a password against the stored hash of an account"""
+        if account.salt:
+            _, hashed_password = self.hash_password(password, account.salt)
+        else:
+            hashed_password = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(account.password, hashed_password)
+    
+    def generate_account_number(self) -> Optional[str]:
+        """Generate a unique 6-digit account number, or None once they have all been used"""
+        while self._next_account_seq < ACCOUNT_NUMBER_COUNT:
+            seq = self._next_account_seq
+            self._next_account_seq += 1
+            account_number = str(100000 + (seq * ACCOUNT_NUMBER_MULTIPLIER) % ACCOUNT_NUMBER_COUNT)
+            # Older accounts were numbered at random and may already hold this number
             if not self.account_exists(account_number):
                 return account_number
+        return None
     
-    def account_exists(self, account_number):
+    def account_exists(self, account_number: str) -> bool:
         """Check if an account number already exists"""
-        with open(self.accounts_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    acc_num = line.split(",")[0]
-                    if acc_num == account_number:
-                        return True
-        return False
-    
-    def get_account(self, account_number):
+        return account_number in self._accounts
+    
+    def get_account(self, account_number: str) -> Optional[Account]:
         """Retrieve account details by account number"""
-        with open(self.accounts_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    parts = line.strip().split(",")
-                    if parts[0] == account_number:
-                        return Account(parts[0], parts[1], parts[2], parts[3])
-        return None
+        return self._accounts.get(account_number)
     
-    def create_account(self, name, initial_deposit, password):
+    def create_account(self, name: str, initial_deposit: int, password: str) -> tuple[bool, str]:
         """Create a new bank account"""
         if initial_deposit <= 0:
             return False, "Initial deposit must be positive."
         
+        if initial_deposit > MAX_BALANCE:
+            return False, "Amount too large."
+        
+        if len(name.encode()) > 32:
+            return False, "Name must be at most 32 bytes when UTF-8 encoded."
+        
         account_number = self.generate_account_number()
-        hashed_password = self.hash_password(password)
+        if account_number is None:
+            return False, "No account numbers left."
+        salt, hashed_password = self.hash_password(password)
+        
+        # Save account to the end of the accounts file
+        account = Account(account_number, name, hashed_password, initial_deposit, salt)
+        offset = len(self._offsets) * ACCOUNT_RECORD.size
+        self.write_record(offset, self.pack_account(account))
+        self._accounts[account_number] = account
+        self._offsets[account_number] = offset
         
-        # Save account to file
-        with open(self.accounts_file, "a") as f:
-            f.write(f"{account_number},{name},{hashed_password},{initial_deposit}\n")
+        # A brand new account has no history on disk, so its cache starts out complete
+        self._transactions[account_number] = []
         
         # Log the initial deposit as a transaction
         self.log_transaction(account_number, "Deposit", initial_deposit)
+        self.flush_transactions()
+        
+        # Nobody logs out after creating an account, so drop the new password here
+        _hash_password.cache_clear()
         
         return True, account_number
     
-    def login(self, account_number, password):
+    def login(self, account_number: str, password: str) -> tuple[bool, str]:
         """Authenticate a user"""
         account = self.get_account(account_number)
         if not account:
             return False, "Account not found."
         
-        hashed_password = self.hash_password(password)
-        if account.password != hashed_password:
+        if not self.verify_password(account, password):
+            _hash_password.cache_clear()
             return False, "Incorrect password."
         
+        # Upgrade old SHA-256 hashes to scrypt now that we know the password
+        if not account.salt:
+            account.salt, account.password = self.hash_password(password)
+            password_fields = bytes.fromhex(account.salt) + bytes.fromhex(account.password)
+            self.write_record(self._offsets[account_number] + PASSWORD_OFFSET, password_fields)
+        
         self.current_account = account
         return True, "Login successful!"
     
-    def logout(self):
+    def logout(self) -> None:
         """Log out the current user"""
+        self.flush_transactions()
         self.current_account = None
+        # Don't keep password material around for the next user
+        _hash_password.cache_clear()
     
-    def deposit(self, amount):
+    def deposit(self, amount: int) -> tuple[bool, str]:
         """Deposit money into the current account"""
         if not self.current_account:
             return False, "No account logged in."
@@ -136,10 +389,12 @@ class BankingSystem:
         if success:
             self.update_account_balance()
             self.log_transaction(self.current_account.account_number, "Deposit", amount)
+            # The balance is already on disk, so its record must not wait behind a prompt
+            self.flush_transactions()
         
         return success, message
     
-    def withdraw(self, amount):
+    def withdraw(self, amount: int) -> tuple[bool, str]:
         """Withdraw money from the current account"""
         if not self.current_account:
             return False, "No account logged in."
@@ -148,114 +403,198 @@ class BankingSystem:
         if success:
             self.update_account_balance()
             self.log_transaction(self.current_account.account_number, "Withdrawal", amount)
+            # The balance is already on disk, so its record must not wait behind a prompt
+            self.flush_transactions()
         
         return success, message
     
-    def update_account_balance(self):
-        """Update the account balance in the file"""
-        accounts = []
-        
-        # Read all accounts
-        with open(self.accounts_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    parts = line.strip().split(",")
-                    if parts[0] == self.current_account.account_number:
-                        parts[3] = str(self.current_account.balance)
-                    accounts.append(",".join(parts))
-        
-        # Write back all accounts with updated balance
-        with open(self.accounts_file, "w") as f:
-            for account in accounts:
-                f.write(f"{account}\n")
-    
-    def log_transaction(self, account_number, transaction_type, amount):
-        """Log a transaction to the transactions file"""
-        today = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.transactions_file, "a") as f:
-            f.write(f"{account_number},{transaction_type},{amount},{today}\n")
-    
-    def get_transaction_history(self):
+    def update_account_balance(self) -> None:
+        """Overwrite the current account's balance in place"""
+        account = self.current_account
+        if not account:
+            return
+        
+        offset = self._offsets[account.account_number] + BALANCE_OFFSET
+        self.write_record(offset, struct.pack("<Q", account.balance))
+    
+    def timestamp(self) -> str:
+        """Current local time as a string, only formatted again once the second changes"""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = _now_str(now)
+            self._last_ts_sec = now
+        return self._last_ts_str
+    
+    def log_transaction(self, account_number: str, transaction_type: str, amount: int) -> None:
+        """Queue a transaction to be written to the transactions file"""
+        today = self.timestamp()
+        self._txn_buffer.append(f"{account_number},{transaction_type},{_format_dollars(amount)},{today}\n")
+        
+        # Keep the in-memory history current if it has already been loaded
+        if account_number in self._transactions:
+            self._transactions[account_number].append({
+                "type": transaction_type,
+                "amount": amount,
+                "date": today
+            })
+    
+    def flush_transactions(self) -> None:
+        """Write all queued transactions to the transactions file in one go"""
+        if not self._txn_buffer:
+            return
+        
+        self._txn_fh.write("".join(self._txn_buffer))
+        self._txn_fh.flush()
+        self._txn_buffer.clear()
+    
+    def load_transactions(self, account_number: str) -> list[Transaction]:
+        """Read the transaction history of one account from the transactions file"""
+        self.flush_transactions()
+        if os.path.getsize(self.transactions_file) == 0:
+            return []  # mmap can't map an empty file
+        
+        # account,type,amount,date - the date might contain commas, so it takes the rest of the line
+        pattern = re.compile(
+            rb"^" + re.escape(account_number.encode()) + rb",([^,\r\n]*),([^,\r\n]*),([^\r\n]*)",
+            re.MULTILINE
+        )
+        transactions: list[Transaction] = []
+        unreadable = 0
+        with open(self.transactions_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in pattern.finditer(mm):
+                    transaction_type, amount, date = match.groups()
+                    try:
+                        cents = _parse_cents(amount.decode())
+                    except ValueError:
+                        unreadable += 1
+                        continue
+                    transactions.append({
+                        "type": transaction_type.decode(),
+                        "amount": cents,
+                        "date": date.decode()
+                    })
+        self.unreadable_transactions[account_number] = unreadable
+        return transactions
+    
+    def get_transaction_history(self) -> list[Transaction]:
         """Get transaction history for the current account"""
         if not self.current_account:
             return []
         
-        transactions = []
-        with open(self.transactions_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    parts = line.strip().split(",")
-                    if parts[0] == self.current_account.account_number:
-                        # The date might have a space in it, so join all parts after the amount
-                        date_parts = parts[3:]
-                        date = ",".join(date_parts)
-                        transactions.append({
-                            "type": parts[1],
-                            "amount": float(parts[2]),
-                            "date": date
-                        })
+        account_number = self.current_account.account_number
+        if account_number not in self._transactions:
+            self._transactions[account_number] = self.load_transactions(account_number)
         
         # Sort transactions by date (newest first)
-        transactions.reverse()
-        return transactions
+        return self._transactions[account_number][::-1]
+
 
+# Skip animations and pauses when output isn't a terminal or BANK_FAST is set
+_FAST_MODE = not sys.stdout.isatty() or bool(os.environ.get("BANK_FAST"))
 
-def clear_screen():
+def clear_screen() -> None:
     """Clear the console screen"""
     os.system('cls' if os.name == 'nt' else 'clear')
 
-def print_loading_animation(text="Loading", duration=1.5):
+def _pause(seconds: float) -> None:
+    """Pause so the user can read a message, skipped in fast mode"""
+    if not _FAST_MODE:
+        time.sleep(seconds)
+
+def print_loading_animation(text: str = "Loading", duration: float = 1.5) -> None:
     """Display a loading animation"""
-    animation = "|/-\\"
+    if _FAST_MODE:
+        return
+    
+    # Encode the four frames up front and write them straight to the file descriptor
+    frames = [f"\r{text} {char}".encode() for char in "|/-\\"]
+    stdout_fd = sys.stdout.fileno()
     idx = 0
     end_time = time.time() + duration
     
-    print("")
+    print("", flush=True)  # Anything still buffered must come out before the raw writes
     while time.time() < end_time:
-        print(f"\r{text} {animation[idx % len(animation)]}", end="")
+        os.write(stdout_fd, frames[idx & 3])
         idx += 1
         time.sleep(0.1)
     print("\r" + " " * (len(text) + 2))  # Clear the line
 
-def print_header(text):
-    """Print a styled header"""
+def format_header(text: str) -> str:
+    """Build a styled header"""
     width = 50
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'═' * width}")
-    print(f"{text.center(width)}")
-    print(f"{'═' * width}{Colors.ENDC}")
+    return (f"\n{Colors.HEADER}{Colors.BOLD}{'═' * width}\n"
+            f"{text.center(width)}\n"
+            f"{'═' * width}{Colors.ENDC}")
 
-def print_success(text):
+def print_header(text: str) -> None:
+    """Print a styled header"""
+    print(format_header(text))
+
+def print_success(text: str) -> None:
     """Print a success message"""
-    print(f"{Colors.GREEN}{text}{Colors.ENDC}")
+    print(text if _NO_COLOR else f"{Colors.GREEN}{text}{Colors.ENDC}")
 
-def print_error(text):
+def print_error(text: str) -> None:
     """Print an error message"""
-    print(f"{Colors.FAIL}{text}{Colors.ENDC}")
+    print(text if _NO_COLOR else f"{Colors.FAIL}{text}{Colors.ENDC}")
 
-def print_info(text):
+def print_info(text: str) -> None:
     """Print an info message"""
-    print(f"{Colors.CYAN}{text}{Colors.ENDC}")
+    print(text if _NO_COLOR else f"{Colors.CYAN}{text}{Colors.ENDC}")
 
-def print_warning(text):
+def print_warning(text: str) -> None:
     """Print a warning message"""
-    print(f"{Colors.WARNING}{text}{Colors.ENDC}")
+    print(text if _NO_COLOR else f"{Colors.WARNING}{text}{Colors.ENDC}")
+
+def format_menu_option(number: int, text: str) -> str:
+    """Build a menu option"""
+    return f"{Colors.BLUE}[{number}] {Colors.ENDC}{text}"
 
-def print_menu_option(number, text):
+def print_menu_option(number: int, text: str) -> None:
     """Print a menu option"""
-    print(f"{Colors.BLUE}[{number}] {Colors.ENDC}{text}")
+    print(format_menu_option(number, text))
 
-def print_balance(balance):
+def print_balance(balance: int) -> None:
     """Print the balance with color based on amount"""
-    if balance > 1000:
+    if balance > 1000_00:
         color = Colors.GREEN
     elif balance > 0:
         color = Colors.BLUE
     else:
         color = Colors.WARNING
     
-    print(f"Current Balance: {color}${balance:.2f}{Colors.ENDC}")
+    print(f"Current Balance: {color}${balance / 100:.2f}{Colors.ENDC}")
 
-def show_welcome_screen():
+# Menu text never changes, so build it once at import time
+_PROMPT_CHOICE = f"\n{Colors.BOLD}Enter your choice: {Colors.ENDC}"
+_PROMPT_CONTINUE = f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}"
+_MAIN_MENU = "\n".join([
+    format_header("MAIN MENU"),
+    format_menu_option(1, "Create Account"),
+    format_menu_option(2, "Login"),
+    format_menu_option(3, "Exit"),
+])
+_LOGGED_IN_OPTIONS = "\n".join([
+    "\n" + "─" * 50,
+    format_menu_option(1, "Deposit Funds"),
+    format_menu_option(2, "Withdraw Funds"),
+    format_menu_option(3, "View Transaction History"),
+    format_menu_option(4, "Logout"),
+    "─" * 50,
+])
+_HEADER_CREATE_ACCOUNT = format_header("CREATE NEW ACCOUNT")
+_HEADER_LOGIN = format_header("LOGIN")
+_HEADER_DEPOSIT = format_header("DEPOSIT FUNDS")
+_HEADER_WITHDRAW = format_header("WITHDRAW FUNDS")
+_HEADER_TRANSACTIONS = format_header("TRANSACTION HISTORY")
+_TRANSACTIONS_TABLE_HEADER = "\n".join([
+    "\n" + "─" * 60,
+    f"{Colors.BOLD}{'Type':<12} {'Amount':<12} {'Date':<24}{Colors.ENDC}",
+    "─" * 60,
+])
+
+def show_welcome_screen() -> None:
     """Display an attractive welcome screen"""
     clear_screen()
     print("\n" + "═" * 60)
@@ -276,20 +615,29 @@ def show_welcome_screen():
     """ + f"{Colors.ENDC}")
     print(" " * 15 + f"{Colors.BOLD}Your Secure Banking Solution{Colors.ENDC}")
     print("═" * 60 + "\n")
-    time.sleep(2)
+    _pause(2)
 
-def type_effect(text, delay=0.03):
+def type_effect(text: str, delay: float = 0.03) -> None:
     """Create a typing effect for text"""
+    if _FAST_MODE:
+        print(text)
+        return
+    
     for char in text:
         sys.stdout.write(char)
         sys.stdout.flush()
         time.sleep(delay)
     print()
 
-def main():
+def main() -> None:
     bank = BankingSystem()
     show_welcome_screen()
     
+    if bank.import_warnings:
+        for warning in bank.import_warnings:
+            print_warning(warning)
+        input(_PROMPT_CONTINUE)
+    
     while True:
         clear_screen()
         if bank.current_account:
@@ -297,14 +645,11 @@ def main():
         else:
             main_menu(bank)
 
-def main_menu(bank):
+def main_menu(bank: BankingSystem) -> None:
     """Display the main menu for logged-out users"""
-    print_header("MAIN MENU")
-    print_menu_option(1, "Create Account")
-    print_menu_option(2, "Login")
-    print_menu_option(3, "Exit")
+    print(_MAIN_MENU)
     
-    choice = input(f"\n{Colors.BOLD}Enter your choice: {Colors.ENDC}")
+    choice = input(_PROMPT_CHOICE)
     
     if choice == "1":
         create_account_menu(bank)
@@ -313,22 +658,22 @@ def main_menu(bank):
     elif choice == "3":
         clear_screen()
         type_effect(f"{Colors.GREEN}Thank you for using our Banking System! Goodbye!{Colors.ENDC}")
-        time.sleep(1.5)
+        _pause(1.5)
         exit()
     else:
         print_error("Invalid choice. Please try again.")
-        time.sleep(1)
+        _pause(1)
 
-def create_account_menu(bank):
+def create_account_menu(bank: BankingSystem) -> None:
     """Handle the account creation process"""
     clear_screen()
-    print_header("CREATE NEW ACCOUNT")
+    print(_HEADER_CREATE_ACCOUNT)
     
     name = input(f"{Colors.CYAN}Enter your name: {Colors.ENDC}")
     
     while True:
         try:
-            initial_deposit = float(input(f"{Colors.CYAN}Enter your initial deposit ($): {Colors.ENDC}"))
+            initial_deposit = _to_cents(input(f"{Colors.CYAN}Enter your initial deposit ($): {Colors.ENDC}"))
             if initial_deposit <= 0:
                 print_error("Initial deposit must be positive.")
                 continue
@@ -362,12 +707,12 @@ def create_account_menu(bank):
     else:
         print_error(f"Error: {result}")
     
-    input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+    input(_PROMPT_CONTINUE)
 
-def login_menu(bank):
+def login_menu(bank: BankingSystem) -> None:
     """Handle the login process"""
     clear_screen()
-    print_header("LOGIN")
+    print(_HEADER_LOGIN)
     
     account_number = input(f"{Colors.CYAN}Enter your account number: {Colors.ENDC}")
     
@@ -383,27 +728,24 @@ def login_menu(bank):
     
     if success:
         print_success(f"\n✓ {message}")
-        time.sleep(1)
+        _pause(1)
     else:
         print_error(f"\n✗ {message}")
-        input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+        input(_PROMPT_CONTINUE)
 
-def logged_in_menu(bank):
+def logged_in_menu(bank: BankingSystem) -> None:
     """Display the menu for logged-in users"""
     account = bank.current_account
+    if not account:
+        return
     
     print_header(f"WELCOME, {account.name.upper()}!")
     print_info(f"Account Number: {account.account_number}")
     print_balance(account.balance)
     
-    print("\n" + "─" * 50)
-    print_menu_option(1, "Deposit Funds")
-    print_menu_option(2, "Withdraw Funds")
-    print_menu_option(3, "View Transaction History")
-    print_menu_option(4, "Logout")
-    print("─" * 50)
+    print(_LOGGED_IN_OPTIONS)
     
-    choice = input(f"\n{Colors.BOLD}Enter your choice: {Colors.ENDC}")
+    choice = input(_PROMPT_CHOICE)
     
     if choice == "1":
         deposit_menu(bank)
@@ -415,18 +757,18 @@ def logged_in_menu(bank):
         print_loading_animation("Logging out", 1)
         bank.logout()
         print_success("Logged out successfully!")
-        time.sleep(1)
+        _pause(1)
     else:
         print_error("Invalid choice. Please try again.")
-        time.sleep(1)
+        _pause(1)
 
-def deposit_menu(bank):
+def deposit_menu(bank: BankingSystem) -> None:
     """Handle deposit process"""
     clear_screen()
-    print_header("DEPOSIT FUNDS")
+    print(_HEADER_DEPOSIT)
     
     try:
-        amount = float(input(f"{Colors.CYAN}Enter amount to deposit ($): {Colors.ENDC}"))
+        amount = _to_cents(input(f"{Colors.CYAN}Enter amount to deposit ($): {Colors.ENDC}"))
         
         print_loading_animation("Processing deposit", 1.5)
         
@@ -439,30 +781,31 @@ def deposit_menu(bank):
     except ValueError:
         print_error("\nPlease enter a valid amount.")
     
-    input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+    input(_PROMPT_CONTINUE)
 
-def withdraw_menu(bank):
+def withdraw_menu(bank: BankingSystem) -> None:
     """Handle withdrawal process"""
     clear_screen()
-    print_header("WITHDRAW FUNDS")
+    print(_HEADER_WITHDRAW)
     
     try:
-        amount = float(input(f"{Colors.CYAN}Enter amount to withdraw ($): {Colors.ENDC}"))
+        amount = _to_cents(input(f"{Colors.CYAN}Enter amount to withdraw ($): {Colors.ENDC}"))
         
         print_loading_animation("Processing withdrawal", 1.5)
         
         success, message = bank.withdraw(amount)
         
-        if success:
+        account = bank.current_account
+        if success and account:
             print_success(f"\n✓ {message}")
             # ASCII art receipt
             print("\n" + "─" * 35)
             print("         WITHDRAWAL RECEIPT         ")
             print("─" * 35)
-            print(f" Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f" Account: {bank.current_account.account_number}")
-            print(f" Amount: ${amount:.2f}")
-            print(f" Remaining: ${bank.current_account.balance:.2f}")
+            print(f" Date: {_now_str()}")
+            print(f" Account: {account.account_number}")
+            print(f" Amount: ${amount / 100:.2f}")
+            print(f" Remaining: ${account.balance / 100:.2f}")
             print("─" * 35)
             print("      Thank you for banking with us!      ")
             print("─" * 35)
@@ -471,23 +814,26 @@ def withdraw_menu(bank):
     except ValueError:
         print_error("\nPlease enter a valid amount.")
     
-    input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+    input(_PROMPT_CONTINUE)
 
-def view_transactions(bank):
+def view_transactions(bank: BankingSystem) -> None:
     """Display transaction history"""
     clear_screen()
-    print_header("TRANSACTION HISTORY")
+    print(_HEADER_TRANSACTIONS)
     
     print_loading_animation("Fetching transactions", 1.5)
     
     transactions = bank.get_transaction_history()
     
+    account = bank.current_account
+    unreadable = bank.unreadable_transactions.get(account.account_number, 0) if account else 0
+    if unreadable:
+        print_warning(f"Skipped {unreadable} transaction(s) with an unreadable amount.")
+    
     if not transactions:
         print_warning("No transactions found.")
     else:
-        print("\n" + "─" * 60)
-        print(f"{Colors.BOLD}{'Type':<12} {'Amount':<12} {'Date':<24}{Colors.ENDC}")
-        print("─" * 60)
+        print(_TRANSACTIONS_TABLE_HEADER)
         
         for transaction in transactions:
             if transaction['type'] == "Deposit":
@@ -496,26 +842,26 @@ def view_transactions(bank):
                 type_color = Colors.BLUE
             
             print(f"{type_color}{transaction['type']:<12}{Colors.ENDC} "
-                  f"${transaction['amount']:<11.2f} {transaction['date']}")
+                  f"${transaction['amount'] / 100:<11.2f} {transaction['date']}")
         
         print("─" * 60)
     
-    input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+    input(_PROMPT_CONTINUE)
 
 
-if __name__ == "__main__":
-    # Try to handle terminal that don't support ANSI colors
-    try:
-        os.system('color')  # Windows 10 support for ANSI
-    except:
-        # If colors aren't supported, make them empty strings
-        for attr in dir(Colors):
-            if not attr.startswith('__'):
-                setattr(Colors, attr, '')
+def run() -> None:
+    """Set up the terminal and run the app, exiting cleanly on Ctrl+C"""
+    # Windows 10 consoles only handle ANSI codes once this has been run
+    if not _NO_COLOR and os.name == 'nt':
+        os.system('color')
     
     try:
         main()
     except KeyboardInterrupt:
         clear_screen()
         print(f"\n{Colors.WARNING}Program terminated by user.{Colors.ENDC}")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    run()
\ No newline at end of file